@@ -0,0 +1,55 @@
+package internal
+
+import (
+	"testing"
+)
+
+// Цены с участками, где цена не меняется. На таких участках быстрая и
+// медленная SMA совпадают, и сравнения вида
+// prevFast <= prevSlow && currFast > currSlow зависят от последних битов.
+var flatRunCloses = []float64{
+	3264.4, 3265.7, 3263.1, 3270.9, 3268.3, 3261.7,
+	100.1, 100.1, 100.1, 100.1, 100.1, 100.1, 100.1, 100.1, 100.1, 100.1,
+	101.37, 99.83, 100.29, 102.61, 98.07,
+	100.1, 100.1, 100.1, 100.1, 100.1, 100.1, 100.1, 100.1,
+}
+
+func flatRunCandles() []Candle {
+	candles := make([]Candle, len(flatRunCloses))
+	for i, c := range flatRunCloses {
+		candles[i] = Candle{Close: Price(c)}
+	}
+	return candles
+}
+
+// windowSMA считает SMA только по свечам самого окна, без истории до него
+func windowSMA(candles []Candle, end, period int) float64 {
+	return CalculateSMACommon(candles[end-period+1:end+1], period)[period-1]
+}
+
+func TestCalculateSMACommon_DependsOnlyOnWindow(t *testing.T) {
+	candles := flatRunCandles()
+
+	for _, period := range []int{2, 3, 5, 7} {
+		sma := CalculateSMACommon(candles, period)
+		for i := period - 1; i < len(candles); i++ {
+			if want := windowSMA(candles, i, period); sma[i] != want {
+				t.Errorf("period %d: SMA[%d] = %.17g, expected %.17g (history must not leak into the window)", period, i, sma[i], want)
+			}
+		}
+	}
+}
+
+func TestCalculateSMACommonForValues_DependsOnlyOnWindow(t *testing.T) {
+	candles := flatRunCandles()
+
+	// Периоды отличаются от остальных тестов: результат кэшируется по периоду
+	for _, period := range []int{4, 6} {
+		sma := CalculateSMACommonForValues(flatRunCloses, period)
+		for i := period - 1; i < len(flatRunCloses); i++ {
+			if want := windowSMA(candles, i, period); sma[i] != want {
+				t.Errorf("period %d: SMA[%d] = %.17g, expected %.17g (history must not leak into the window)", period, i, sma[i], want)
+			}
+		}
+	}
+}
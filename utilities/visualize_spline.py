@@ -1,9 +1,37 @@
+import hashlib
 import json
+import zipfile
+from pathlib import Path
+
 import matplotlib.pyplot as plt
 import numpy as np
 from mpl_toolkits.mplot3d import Axes3D
 import matplotlib.tri as tri
 
+# Delaunay triangulation is deterministic for a given XY grid,
+# so keep the triangle indices of the last grid next to the script.
+# Only worth it for large grids; a single file avoids orphaned caches
+TRI_CACHE = Path(__file__).with_name('.grid_search_tri.npz')
+
+def load_triangulation(x, y):
+    key = hashlib.md5(
+        str(x.dtype).encode() + x.tobytes() + str(y.dtype).encode() + y.tobytes()
+    ).hexdigest()
+
+    try:
+        with np.load(TRI_CACHE) as cached:
+            if str(cached['key']) == key:
+                return tri.Triangulation(x, y, triangles=cached['triangles'])
+    except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+        pass  # missing, stale or corrupt cache - recompute
+
+    triang = tri.Triangulation(x, y)
+    try:
+        np.savez(TRI_CACHE, key=key, triangles=triang.triangles)
+    except OSError:
+        pass  # cache is optional
+    return triang
+
 def main():
     # Read mesh data
     with open('grid_search_results.json', 'r') as f:
@@ -19,7 +47,7 @@ def main():
     ax = fig.add_subplot(111, projection='3d')
     
     # Create a triangulated surface
-    triang = tri.Triangulation(min_lengths, max_lengths)
+    triang = load_triangulation(min_lengths, max_lengths)
     surf = ax.plot_trisurf(triang, profits, cmap='viridis', edgecolor='none')
     
     ax.set_xlabel('X')